@@ -1,10 +1,13 @@
+import logging
 import streamlit as st
 from pathlib import Path
+from src.config import Config
 from src.fake_news_classifier import FakeNewsClassifier
-from src.logger import setup_logger
+from src.logger import configure_logging
 
-# Setup logger
-logger = setup_logger(__name__)
+# Configure the root logger once; all modules inherit it via getLogger
+configure_logging()
+logger = logging.getLogger(__name__)
 
 # Page configuration
 st.set_page_config(
@@ -36,6 +39,7 @@ st.markdown("""
     height: 250px;
     text-align: center;
     animation: fadeIn 0.4s ease-in;
+    will-change: opacity, transform;
 }
 .loader {
     border: 6px solid rgba(255, 255, 255, 0.2);
@@ -45,6 +49,10 @@ st.markdown("""
     height: 60px;
     animation: spin 1.2s linear infinite;
     margin-bottom: 15px;
+    /* Promote to a compositor layer so the rotation runs on the GPU
+       without re-running layout/paint every frame */
+    will-change: transform;
+    transform: translateZ(0);
 }
 @keyframes spin {
     0% { transform: rotate(0deg); }
@@ -102,13 +110,29 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Loader markup shared by the initial and early-label states
+_LOADER_HTML = """
+<div class='card loader-container'>
+    <div class='loader'></div>
+    <div class='loading-text'>{message}</div>
+</div>
+"""
+
+
+@st.cache_resource
+def get_classifier() -> FakeNewsClassifier:
+    """Build the classifier once per server process and share it across sessions."""
+    classifier = FakeNewsClassifier()
+    # Load the model into memory now so the first analysis doesn't pay the
+    # cold-start cost; cache_resource ensures this runs once per process
+    classifier.model_handler.warm_up()
+    logger.info("Classifier initialized successfully")
+    return classifier
+
+
 def initialize_session_state():
-    if 'classifier' not in st.session_state:
-        st.session_state.classifier = None
     if 'latest_result' not in st.session_state:
         st.session_state.latest_result = None
-    if 'is_loading' not in st.session_state:
-        st.session_state.is_loading = False
 
 
 def render_hero():
@@ -151,13 +175,16 @@ def render_result_card(result: dict):
 
 
 def main():
+    # Validate configuration once per session rather than on every import,
+    # since Streamlit re-runs the script on each widget interaction
+    if "config_validated" not in st.session_state:
+        st.session_state.config_validated = Config.validate()
+
     initialize_session_state()
     render_hero()
 
-    if st.session_state.classifier is None:
-        with st.spinner("Initializing classifier..."):
-            st.session_state.classifier = FakeNewsClassifier()
-            logger.info("Classifier initialized successfully")
+    with st.spinner("Initializing classifier..."):
+        classifier = get_classifier()
 
     left_col, right_col = st.columns([1, 2], gap="large")
 
@@ -173,41 +200,33 @@ def main():
             if not news_text.strip():
                 st.warning("Please enter text to analyze.")
             else:
-                st.session_state.is_loading = True
                 placeholder = st.empty()
 
                 # Show animated loader
                 placeholder.markdown(
-                    """
-                    <div class='card loader-container'>
-                        <div class='loader'></div>
-                        <div class='loading-text'>Analyzing your content...</div>
-                    </div>
-                    """,
+                    _LOADER_HTML.format(message="Analyzing your content..."),
                     unsafe_allow_html=True
                 )
 
+                def show_early_label(label):
+                    # The label streams in well before the reasoning finishes;
+                    # surface it on the loader while generation continues
+                    verdict = 'real' if label == 'REAL' else 'fake'
+                    placeholder.markdown(
+                        _LOADER_HTML.format(message=f"Looks {verdict} — writing explanation..."),
+                        unsafe_allow_html=True
+                    )
+
                 try:
-                    result = st.session_state.classifier.classify(news_text)
+                    result = classifier.classify(news_text, on_label=show_early_label)
                     st.session_state.latest_result = result
                 except Exception as e:
                     st.error(f"❌ **Analysis Error:** {str(e)}")
                     logger.error(f"Classification error: {e}")
                 finally:
-                    st.session_state.is_loading = False
                     placeholder.empty()
 
-        if st.session_state.is_loading:
-            st.markdown(
-                """
-                <div class='card loader-container'>
-                    <div class='loader'></div>
-                    <div class='loading-text'>Analyzing your content...</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        elif st.session_state.latest_result:
+        if st.session_state.latest_result:
             render_result_card(st.session_state.latest_result)
         else:
             st.markdown(
@@ -1,19 +1,21 @@
 
 import os
+import logging
 from pathlib import Path
 from dotenv import load_dotenv
-from src.logger import setup_logger
 
 # Load environment variables from .env file
 env_path = Path('.') / '.env'
 load_dotenv(dotenv_path=env_path)
 
-# Initialize logger
-logger = setup_logger(__name__, os.getenv('LOG_LEVEL', 'INFO'))
+logger = logging.getLogger(__name__)
 
 class Config:
     """Configuration class for the Fake News Detection system."""
-    
+
+    # Settings live on the class itself; instances carry no state
+    __slots__ = ()
+
     # Ollama API Configuration
     OLLAMA_BASE_URL = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
     OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'llama3:8b')
@@ -22,10 +24,22 @@ class Config:
     # API Timeout and Retry Configuration
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '120'))
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
+
+    # Concurrency bound for async requests; should match the server's
+    # OLLAMA_NUM_PARALLEL, beyond which Ollama queues requests anyway
+    OLLAMA_NUM_PARALLEL = int(os.getenv('OLLAMA_NUM_PARALLEL', '4'))
     
     # Model Parameters
     TEMPERATURE = float(os.getenv('TEMPERATURE', '0.1'))
-    MAX_TOKENS = int(os.getenv('MAX_TOKENS', '500'))
+    # The structured answer (label, confidence, reasoning) fits well under
+    # this bound; generation time scales with tokens produced
+    MAX_TOKENS = int(os.getenv('MAX_TOKENS', '220'))
+    # Context window; KV-cache cost scales with num_ctx, so this is sized to
+    # the worst case rather than the model default: validate_input allows
+    # articles up to 10000 characters, giving a prompt of roughly 2700
+    # tokens, plus the MAX_TOKENS generation budget. Ollama silently
+    # truncates prompts that exceed num_ctx.
+    NUM_CTX = int(os.getenv('NUM_CTX', '4096'))
     
     # Logging Configuration
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -55,6 +69,3 @@ class Config:
         except AssertionError as e:
             logger.error(f"Configuration validation failed: {e}")
             return False
-
-# Validate configuration on import
-Config.validate()
@@ -1,103 +1,137 @@
-import regex as re # <-- MODIFIED: Use 'regex' for advanced Unicode support
+import re
+import logging
 from typing import Optional
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns so the hot path is a direct call into the compiled
+# matcher instead of re-parsing the pattern on every invocation
+_WS_RE = re.compile(r'\s+')
+_STRIP_RE = re.compile(r'[^\w\s.,!?;:\'-]', re.UNICODE)
+_DUP_PUNCT_RE = re.compile(r'([.,!?;:])\1+')
+# Whitespace that the \s+ collapse would actually change: a run of two or
+# more, or any whitespace character that is not a plain space
+_EXTRA_WS_RE = re.compile(r'\s\s|[^\S ]')
+
+def clean_text(text: str) -> str:
+    """
+    Clean and normalize input text for multilingual support.
+
+    Args:
+        text: Raw input text
+
+    Returns:
+        Cleaned and normalized text
+    """
+    if not text or not isinstance(text, str):
+        logger.warning("Empty or invalid text provided for cleaning")
+        return ""
+
+    # Fast path: typical input needs no cleaning at all. Each search
+    # short-circuits on the first offending character, so clean input
+    # costs three C-level scans and no new string allocations.
+    if (_STRIP_RE.search(text) is None
+            and _DUP_PUNCT_RE.search(text) is None
+            and _EXTRA_WS_RE.search(text) is None):
+        return text.strip()
+
+    try:
+        # Remove extra whitespace
+        text = _WS_RE.sub(' ', text)
+
+        # --- MODIFICATION 1: Multilingual Character Filtering ---
+        # Remove special characters but keep basic punctuation.
+        # We use re.UNICODE to ensure \w includes word characters from all languages.
+        # The pattern is now less restrictive to preserve Hindi/Telugu characters.
+        # We keep only only Unicode word chars (\w), whitespace (\s), and basic English punctuation.
+        text = _STRIP_RE.sub('', text)
+
+        # Remove multiple punctuation marks
+        text = _DUP_PUNCT_RE.sub(r'\1', text)
+
+        # (English-specific capitalization rule was removed)
+
+        logger.debug("Text cleaned successfully. Length: %d", len(text))
+        return text.strip()
+
+    except Exception as e:
+        logger.error(f"Error cleaning text: {e}")
+        return text
+
+def validate_input(text: str, min_length: int = 10, max_length: int = 10000) -> tuple[bool, Optional[str]]:
+    """
+    Validate input text length and content for multilingual support.
+
+    Args:
+        text: Input text to validate
+        min_length: Minimum acceptable length
+        max_length: Maximum acceptable length
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if not text:
+        return False, "Text cannot be empty"
+
+    cleaned_text = text.strip()
+    length = len(cleaned_text)
+
+    if length == 0:
+        return False, "Text cannot be empty"
+
+    if length < min_length:
+        return False, f"Text too short. Minimum {min_length} characters required"
+
+    if length > max_length:
+        return False, f"Text too long. Maximum {max_length} characters allowed"
+
+    # --- MODIFICATION 3: Multilingual Alphabetic Check ---
+    # str.isalpha covers all Unicode letters; the loop breaks on the
+    # first one, which is typically at index 0
+    for ch in cleaned_text:
+        if ch.isalpha():
+            break
+    else:
+        return False, "Text must contain alphabetic characters"
+
+    logger.debug("Input validation passed")
+    return True, None
+
+def extract_features(text: str) -> dict:
+    """
+    Extract basic features from text. Clickbait feature is disabled for multilingual support.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Dictionary of extracted features
+    """
+    features = {
+        'length': len(text),
+        'word_count': len(text.split()),
+        'exclamation_count': text.count('!'),
+        'question_count': text.count('?'),
+        # The uppercase ratio feature is only meaningful for Latin scripts, kept for English context.
+        # map(str.isupper, ...) keeps the per-character loop in C instead of interpreted bytecode.
+        'uppercase_ratio': sum(map(str.isupper, text)) / len(text) if text else 0,
+        # --- MODIFICATION 4: Disable English-specific clickbait check ---
+        'has_clickbait_words': False
+    }
+
+    logger.debug("Extracted features: %s", features)
+    return features
 
 class TextPreprocessor:
-    """Handle text preprocessing and cleaning for news articles."""
-    
-    @staticmethod
-    def clean_text(text: str) -> str:
-        """
-        Clean and normalize input text for multilingual support.
-        
-        Args:
-            text: Raw input text
-            
-        Returns:
-            Cleaned and normalized text
-        """
-        if not text or not isinstance(text, str):
-            logger.warning("Empty or invalid text provided for cleaning")
-            return ""
-        
-        try:
-            # Remove extra whitespace
-            text = ' '.join(text.split())
-            
-            # --- MODIFICATION 1: Multilingual Character Filtering ---
-            # Remove special characters but keep basic punctuation.
-            # We use re.UNICODE to ensure \w includes word characters from all languages.
-            # The pattern is now less restrictive to preserve Hindi/Telugu characters.
-            # We keep only only Unicode word chars (\w), whitespace (\s), and basic English punctuation.
-            text = re.sub(r'[^\w\s.,!?;:\'-]', '', text, flags=re.UNICODE)
-            
-            # Remove multiple punctuation marks
-            text = re.sub(r'([.,!?;:])\1+', r'\1', text)
-            
-            # (English-specific capitalization rule was removed)
-            
-            logger.debug(f"Text cleaned successfully. Length: {len(text)}")
-            return text.strip()
-            
-        except Exception as e:
-            logger.error(f"Error cleaning text: {e}")
-            return text
-    
-    @staticmethod
-    def validate_input(text: str, min_length: int = 10, max_length: int = 10000) -> tuple[bool, Optional[str]]:
-        """
-        Validate input text length and content for multilingual support.
-        
-        Args:
-            text: Input text to validate
-            min_length: Minimum acceptable length
-            max_length: Maximum acceptable length
-            
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        if not text or not text.strip():
-            return False, "Text cannot be empty"
-        
-        cleaned_text = text.strip()
-        
-        if len(cleaned_text) < min_length:
-            return False, f"Text too short. Minimum {min_length} characters required"
-        
-        if len(cleaned_text) > max_length:
-            return False, f"Text too long. Maximum {max_length} characters allowed"
-        
-        # --- MODIFICATION 3: Multilingual Alphabetic Check (Now works with 'regex') ---
-        # Check if text contains at least some alphabetic characters using Unicode letter property (\p{L})
-        if not re.search(r'\p{L}', cleaned_text, flags=re.UNICODE):
-            return False, "Text must contain alphabetic characters"
-        
-        logger.debug("Input validation passed")
-        return True, None
-    
-    @staticmethod
-    def extract_features(text: str) -> dict:
-        """
-        Extract basic features from text. Clickbait feature is disabled for multilingual support.
-        
-        Args:
-            text: Input text
-            
-        Returns:
-            Dictionary of extracted features
-        """
-        features = {
-            'length': len(text),
-            'word_count': len(text.split()),
-            'exclamation_count': text.count('!'),
-            'question_count': text.count('?'),
-            # The uppercase ratio feature is only meaningful for Latin scripts, kept for English context
-            'uppercase_ratio': sum(1 for c in text if c.isupper()) / len(text) if text else 0,
-            # --- MODIFICATION 4: Disable English-specific clickbait check ---
-            'has_clickbait_words': False 
-        }
-        
-        logger.debug(f"Extracted features: {features}")
-        return features
\ No newline at end of file
+    """
+    Handle text preprocessing and cleaning for news articles.
+
+    Thin wrapper kept for backward compatibility; hot callers use the
+    module-level functions directly to skip the class-attribute lookup.
+    """
+
+    __slots__ = ()
+
+    clean_text = staticmethod(clean_text)
+    validate_input = staticmethod(validate_input)
+    extract_features = staticmethod(extract_features)
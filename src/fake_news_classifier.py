@@ -1,18 +1,41 @@
 import re
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+import httpx
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from src.model_handler import OllamaHandler
-from src.data_preprocessing import TextPreprocessor
-from src.logger import setup_logger
+from src.data_preprocessing import clean_text, extract_features, validate_input
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
+
+# Precompiled response-parsing patterns, reused across every classification.
+# The combined pattern extracts all three fields in one pass over the
+# response; the per-field patterns remain as a fallback for partial replies.
+_PARSE_RE = re.compile(
+    r'CLASSIFICATION\s*[:\-]\s*(?P<cls>REAL|FAKE)'
+    r'.*?CONFIDENCE\s*[:\-]\s*(?P<conf>\d{1,3})'
+    r'.*?REASONING\s*[:\-]\s*(?P<reason>.*)',
+    re.IGNORECASE | re.DOTALL
+)
+_CLS_RE = re.compile(r'CLASSIFICATION\s*[:\-]\s*(REAL|FAKE)', re.IGNORECASE)
+_CONF_RE = re.compile(r'CONFIDENCE\s*[:\-]\s*(\d{1,3})', re.IGNORECASE)
+_REASON_RE = re.compile(r'REASONING\s*[:\-]\s*(.*)', re.IGNORECASE | re.DOTALL)
+
+# Maximum number of classification results remembered per classifier
+_CACHE_MAX_ENTRIES = 256
 
 class FakeNewsClassifier:
     """Classify news articles as Real or Fake using Ollama LLM."""
 
+    __slots__ = ('model_handler', '_result_cache')
+
     def __init__(self):
-        """Initialize classifier with model handler and preprocessor."""
+        """Initialize classifier with model handler and result cache."""
         self.model_handler = OllamaHandler()
-        self.preprocessor = TextPreprocessor()
+        # LRU cache of successful results keyed by cleaned text, so repeated
+        # analyses of the same article skip the LLM call entirely
+        self._result_cache = OrderedDict()
         logger.info("FakeNewsClassifier initialized")
 
     def _create_classification_prompt(self, text: str) -> str:
@@ -52,21 +75,25 @@ Be thorough and analytical in your reasoning."""
         Robustly parse Ollama's response to extract classification, confidence, and reasoning.
         """
         try:
-            # Normalize response for easier regex
-            response_upper = response.upper()
-
-            # Extract classification
-            classification_match = re.search(r'CLASSIFICATION\s*[:\-]\s*(REAL|FAKE)', response_upper)
-            classification = classification_match.group(1) if classification_match else "UNKNOWN"
+            match = _PARSE_RE.search(response)
+            if match:
+                # Well-formed response: all three fields in one pass
+                classification = match.group('cls').upper()
+                confidence = max(0, min(100, int(match.group('conf'))))
+                reasoning = match.group('reason').strip()
+            else:
+                # Partial or malformed response: extract what is present.
+                # The patterns are case-insensitive, so only the matched
+                # label is uppercased rather than a full copy of the response
+                classification_match = _CLS_RE.search(response)
+                classification = classification_match.group(1).upper() if classification_match else "UNKNOWN"
 
-            # Extract confidence
-            confidence_match = re.search(r'CONFIDENCE\s*[:\-]\s*(\d{1,3})', response_upper)
-            confidence = int(confidence_match.group(1)) if confidence_match else 50
-            confidence = max(0, min(100, confidence))
+                confidence_match = _CONF_RE.search(response)
+                confidence = int(confidence_match.group(1)) if confidence_match else 50
+                confidence = max(0, min(100, confidence))
 
-            # Extract reasoning
-            reasoning_match = re.search(r'REASONING\s*[:\-]\s*(.*)', response, re.IGNORECASE | re.DOTALL)
-            reasoning = reasoning_match.group(1).strip() if reasoning_match else response.strip()
+                reasoning_match = _REASON_RE.search(response)
+                reasoning = reasoning_match.group(1).strip() if reasoning_match else response.strip()
 
             logger.info(f"Parsed classification: {classification} ({confidence}%)")
             return {
@@ -85,23 +112,126 @@ Be thorough and analytical in your reasoning."""
                 'raw_response': response
             }
 
-    def classify(self, text: str) -> Dict[str, Any]:
+    def classify(self, text: str, on_label: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Classify a news article as Real or Fake.
 
         Args:
             text: News article or headline text
+            on_label: Optional callback invoked with the label as soon as it
+                appears in the model's streamed response
 
         Returns:
             Dictionary containing classification results and metadata
         """
         logger.info("Starting classification process")
 
-        # Validate input
-        is_valid, error_msg = self.preprocessor.validate_input(text)
+        cleaned_text, error_result = self._prepare_input(text)
+        if error_result:
+            return error_result
+
+        cached_result = self._cache_get(cleaned_text)
+        if cached_result is not None:
+            return cached_result
+
+        features = self._extract_features_if_debug(cleaned_text)
+
+        # Create prompt
+        prompt = self._create_classification_prompt(cleaned_text)
+
+        # Get model response
+        model_output = self.model_handler.generate_response(prompt, on_label=on_label)
+
+        result = self._build_result(model_output, features)
+        self._cache_put(cleaned_text, result)
+        return result
+
+    async def aclassify(self, text: str, client: httpx.AsyncClient = None) -> Dict[str, Any]:
+        """
+        Classify a news article as Real or Fake using the async Ollama client.
+
+        Args:
+            text: News article or headline text
+            client: Async client to reuse; when omitted, one is opened and
+                closed around the call
+
+        Returns:
+            Dictionary containing classification results and metadata
+        """
+        cleaned_text, error_result = self._prepare_input(text)
+        if error_result:
+            return error_result
+
+        cached_result = self._cache_get(cleaned_text)
+        if cached_result is not None:
+            return cached_result
+
+        features = self._extract_features_if_debug(cleaned_text)
+
+        prompt = self._create_classification_prompt(cleaned_text)
+        model_output = await self.model_handler.agenerate_response(prompt, client=client)
+
+        result = self._build_result(model_output, features)
+        self._cache_put(cleaned_text, result)
+        return result
+
+    async def classify_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Classify multiple news articles concurrently.
+
+        Args:
+            texts: List of news article or headline texts
+
+        Returns:
+            List of classification result dictionaries, in input order
+        """
+        # One client for the whole batch, so requests share its keep-alive
+        # pool and it is closed before the event loop goes away
+        async with self.model_handler.make_async_client() as client:
+            return await asyncio.gather(*(self.aclassify(text, client) for text in texts))
+
+    def _cache_get(self, cleaned_text: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result for this cleaned text, if any."""
+        cached = self._result_cache.get(cleaned_text)
+        if cached is not None:
+            self._result_cache.move_to_end(cleaned_text)
+            logger.info("Returning cached classification result")
+        return cached
+
+    def _cache_put(self, cleaned_text: str, result: Dict[str, Any]) -> None:
+        """Remember a successful result; failures are never cached."""
+        if not result.get('success'):
+            return
+        self._result_cache[cleaned_text] = result
+        if len(self._result_cache) > _CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+    def _extract_features_if_debug(self, cleaned_text: str) -> Optional[dict]:
+        """
+        Extract text features when debug logging is enabled.
+
+        The features are only used for logging/analysis, so the full-string
+        scan is skipped entirely at INFO and above.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return None
+
+        features = extract_features(cleaned_text)
+        logger.debug("Text features: %s", features)
+        return features
+
+    def _prepare_input(self, text: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Validate and clean input text.
+
+        Returns:
+            Tuple of (cleaned_text, error_result); error_result is None when
+            the input is valid
+        """
+        is_valid, error_msg = validate_input(text)
         if not is_valid:
             logger.warning(f"Input validation failed: {error_msg}")
-            return {
+            return None, {
                 'success': False,
                 'error': error_msg,
                 'classification': None,
@@ -109,19 +239,19 @@ Be thorough and analytical in your reasoning."""
                 'reasoning': None
             }
 
-        # Clean text
-        cleaned_text = self.preprocessor.clean_text(text)
+        return clean_text(text), None
 
-        # Extract features (for logging/analysis)
-        features = self.preprocessor.extract_features(cleaned_text)
-        logger.debug(f"Text features: {features}")
-
-        # Create prompt
-        prompt = self._create_classification_prompt(cleaned_text)
+    def _build_result(self, model_output: Optional[Dict[str, Any]], features: dict) -> Dict[str, Any]:
+        """
+        Parse model output and assemble the final classification result.
 
-        # Get model response
-        model_output = self.model_handler.generate_response(prompt)
+        Args:
+            model_output: Raw output dictionary from the model handler
+            features: Extracted text features to attach to the result
 
+        Returns:
+            Dictionary containing classification results and metadata
+        """
         if not model_output:
             logger.error("Failed to get response from model")
             return {
@@ -1,37 +1,34 @@
 import logging
+import os
 import sys
-from pathlib import Path
 
-def setup_logger(name: str, log_level: str = "INFO") -> logging.Logger:
+def configure_logging(log_level: str = None) -> None:
     """
-    Setup and configure logger with consistent formatting.
-    
+    Configure the root logger once for the whole application.
+
+    Modules obtain their loggers with logging.getLogger(__name__) — a cheap
+    dictionary lookup — and inherit this configuration, instead of each
+    module attaching its own handler at import time.
+
     Args:
-        name: Name of the logger
-        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-    
-    Returns:
-        Configured logger instance
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL);
+            defaults to the LOG_LEVEL environment variable
     """
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
-    
+    if log_level is None:
+        log_level = os.getenv('LOG_LEVEL', 'INFO')
+
+    root = logging.getLogger()
+
+    # Already configured (e.g. on a Streamlit rerun)
+    if root.handlers:
+        return
+
     # Create console handler with formatting
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    
-    # Create formatter
-    formatter = logging.Formatter(
+    console_handler.setFormatter(logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    return logger
\ No newline at end of file
+    ))
+
+    root.addHandler(console_handler)
+    root.setLevel(getattr(logging, log_level.upper()))
@@ -1,15 +1,39 @@
 
+import re
+import logging
 import requests
-import json
-from typing import Optional, Dict, Any
+import orjson
+import asyncio
+import weakref
+import httpx
+from typing import Callable, Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 from src.config import Config
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
+
+def _is_stream_timeout(exc: requests.exceptions.ConnectionError) -> bool:
+    """
+    Detect a read timeout that occurred mid-stream.
+
+    With stream=True, a timeout while iterating the body (i.e. during
+    generation) is raised by requests as a ConnectionError wrapping
+    urllib3's ReadTimeoutError, not as requests.exceptions.Timeout.
+    """
+    return any(isinstance(arg, ReadTimeoutError) for arg in exc.args)
+
+# Classification label appears within the first few streamed tokens of the
+# structured response; used to surface it before generation finishes
+_LABEL_RE = re.compile(r'CLASSIFICATION\s*[:\-]\s*(REAL|FAKE)', re.IGNORECASE)
 
 class OllamaHandler:
     """Handle interactions with Ollama LLM API."""
-    
+
+    __slots__ = ('base_url', 'model', 'endpoint', 'timeout', 'max_retries',
+                 'session', '_loop_sems')
+
     def __init__(self):
         """Initialize Ollama handler with configuration."""
         self.base_url = Config.OLLAMA_BASE_URL
@@ -17,86 +41,306 @@ class OllamaHandler:
         self.endpoint = Config.OLLAMA_API_ENDPOINT
         self.timeout = Config.REQUEST_TIMEOUT
         self.max_retries = Config.MAX_RETRIES
-        
+
+        # Persistent session with keep-alive so the TCP connection to Ollama
+        # is reused across calls instead of re-established per request.
+        # Retries run inside the urllib3 connection pool, reusing the same
+        # connection slot, instead of a Python-level retry loop per call.
+        self.session = requests.Session()
+        self.session.mount(
+            'http://',
+            HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=Config.MAX_RETRIES,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=["POST", "GET"],
+                    raise_on_status=False
+                )
+            )
+        )
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        })
+
+        # Semaphores bounding in-flight async requests, one per event loop
+        # (see _get_semaphore); entries vanish with their loops
+        self._loop_sems = weakref.WeakKeyDictionary()
+
         logger.info(f"Initialized OllamaHandler with model: {self.model}")
+
+    def make_async_client(self) -> httpx.AsyncClient:
+        """
+        Create an httpx.AsyncClient configured for this Ollama server.
+
+        Opened (and closed) by the caller per event loop or batch, typically
+        via `async with`. A client held open from the sync constructor would
+        pin its keep-alive pool to whichever loop first used it and never be
+        closed; Ollama serves the concurrent requests in parallel when the
+        server runs with OLLAMA_NUM_PARALLEL > 1.
+        """
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        )
     
-    def generate_response(self, prompt: str, temperature: float = None) -> Optional[Dict[str, Any]]:
+    def generate_response(self, prompt: str, temperature: float = None,
+                          on_label: Callable[[str], None] = None) -> Optional[Dict[str, Any]]:
         """
-        Generate response from Ollama model.
-        
+        Generate response from Ollama model, streaming chunks as they arrive.
+
         Args:
             prompt: Input prompt for the model
             temperature: Sampling temperature (0.0 to 1.0)
-            
+            on_label: Optional callback invoked with "REAL" or "FAKE" as soon
+                as the classification label appears in the stream, before the
+                rest of the response has been generated
+
         Returns:
             Dictionary containing response and metadata, or None on failure
         """
         if temperature is None:
             temperature = Config.TEMPERATURE
-        
+
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
-            "temperature": temperature,
+            "stream": True,
             "options": {
-                "num_predict": Config.MAX_TOKENS
+                "num_predict": Config.MAX_TOKENS,
+                "num_ctx": Config.NUM_CTX,
+                "temperature": temperature,
+                "stop": ["\n\n\n", "</s>"]
             }
         }
-        
-        logger.info(f"Sending request to Ollama API: {self.endpoint}")
-        logger.debug(f"Prompt length: {len(prompt)} characters")
-        
+
+        logger.info("Sending request to Ollama API: %s", self.endpoint)
+        logger.debug("Prompt length: %d characters", len(prompt))
+
+        # The adapter's Retry policy only covers the connection/header phase;
+        # with streaming, a timeout during generation surfaces while reading
+        # the body, so those are retried here with a fresh request
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.endpoint,
-                    json=payload,
+                    data=orjson.dumps(payload),
                     timeout=self.timeout,
-                    headers={"Content-Type": "application/json"}
+                    stream=True
                 )
-                
+
                 response.raise_for_status()
-                result = response.json()
-                
+
+                # Ollama streams one JSON object per line; the final one has
+                # done=True and carries the timing/eval metadata
+                chunks = []
+                head = ''
+                label_sent = on_label is None
+                final_chunk = {}
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    chunks.append(chunk.get('response', ''))
+                    if not label_sent:
+                        head += chunk.get('response', '')
+                        label_match = _LABEL_RE.search(head)
+                        if label_match:
+                            on_label(label_match.group(1).upper())
+                            label_sent = True
+                    if chunk.get('done'):
+                        final_chunk = chunk
+                full_response = ''.join(chunks)
+
                 logger.info("Successfully received response from Ollama")
-                logger.debug(f"Response: {result.get('response', '')[:100]}...")
-                
+                logger.debug("Response: %.100s...", full_response)
+
                 return {
-                    'response': result.get('response', ''),
-                    'model': result.get('model', self.model),
-                    'total_duration': result.get('total_duration', 0),
-                    'load_duration': result.get('load_duration', 0),
-                    'prompt_eval_count': result.get('prompt_eval_count', 0),
-                    'eval_count': result.get('eval_count', 0)
+                    'response': full_response,
+                    'model': final_chunk.get('model', self.model),
+                    'total_duration': final_chunk.get('total_duration', 0),
+                    'load_duration': final_chunk.get('load_duration', 0),
+                    'prompt_eval_count': final_chunk.get('prompt_eval_count', 0),
+                    'eval_count': final_chunk.get('eval_count', 0)
                 }
-                
+
             except requests.exceptions.Timeout:
                 logger.warning(f"Request timeout (attempt {attempt + 1}/{self.max_retries})")
-                if attempt == self.max_retries - 1:
-                    logger.error("Max retries reached. Request failed.")
+
+            except requests.exceptions.ConnectionError as e:
+                if not _is_stream_timeout(e):
+                    logger.error(f"Connection error: Cannot connect to Ollama at {self.base_url}")
+                    logger.error("Please ensure Ollama is running: 'ollama serve'")
                     return None
-                    
-            except requests.exceptions.ConnectionError:
-                logger.error(f"Connection error: Cannot connect to Ollama at {self.base_url}")
-                logger.error("Please ensure Ollama is running: 'ollama serve'")
-                return None
-                
+                logger.warning(
+                    f"Read timed out while streaming the response "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+
             except requests.exceptions.HTTPError as e:
                 logger.error(f"HTTP error: {e}")
                 logger.error(f"Response: {response.text if response else 'No response'}")
                 return None
-                
-            except json.JSONDecodeError:
+
+            except orjson.JSONDecodeError:
                 logger.error("Failed to decode JSON response from Ollama")
                 return None
-                
+
             except Exception as e:
                 logger.error(f"Unexpected error: {type(e).__name__}: {e}")
                 return None
-        
+
+        logger.error("Max retries reached. Request failed.")
         return None
-    
+
+    async def agenerate_response(self, prompt: str, temperature: float = None,
+                                 client: httpx.AsyncClient = None) -> Optional[Dict[str, Any]]:
+        """
+        Generate response from Ollama model asynchronously.
+
+        Args:
+            prompt: Input prompt for the model
+            temperature: Sampling temperature (0.0 to 1.0)
+            client: Async client to send the request on; when omitted, a
+                short-lived client is opened and closed around the call
+
+        Returns:
+            Dictionary containing response and metadata, or None on failure
+        """
+        if client is None:
+            async with self.make_async_client() as owned_client:
+                return await self.agenerate_response(prompt, temperature, owned_client)
+
+        if temperature is None:
+            temperature = Config.TEMPERATURE
+
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "num_predict": Config.MAX_TOKENS,
+                "num_ctx": Config.NUM_CTX,
+                "temperature": temperature,
+                "stop": ["\n\n\n", "</s>"]
+            }
+        }
+
+        logger.debug("Sending async request to Ollama API: %s", self.endpoint)
+
+        try:
+            async with self._get_semaphore():
+                response = await client.post("/api/generate", content=orjson.dumps(payload))
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            return {
+                'response': result.get('response', ''),
+                'model': result.get('model', self.model),
+                'total_duration': result.get('total_duration', 0),
+                'load_duration': result.get('load_duration', 0),
+                'prompt_eval_count': result.get('prompt_eval_count', 0),
+                'eval_count': result.get('eval_count', 0)
+            }
+
+        except httpx.TimeoutException:
+            logger.error("Async request to Ollama timed out")
+            return None
+
+        except httpx.ConnectError:
+            logger.error(f"Connection error: Cannot connect to Ollama at {self.base_url}")
+            logger.error("Please ensure Ollama is running: 'ollama serve'")
+            return None
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error: {e}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Unexpected error: {type(e).__name__}: {e}")
+            return None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Return the concurrency semaphore for the running event loop.
+
+        A semaphore binds to the loop a task first waits on it in, and this
+        handler outlives any single loop (it is a cache_resource singleton),
+        so a shared instance would raise "bound to a different event loop"
+        on the second asyncio.run(). Keyed weakly by loop, so entries are
+        dropped when their loop is garbage collected.
+        """
+        loop = asyncio.get_running_loop()
+        sem = self._loop_sems.get(loop)
+        if sem is None:
+            sem = self._loop_sems[loop] = asyncio.Semaphore(Config.OLLAMA_NUM_PARALLEL)
+        return sem
+
+    async def generate_batch(self, prompts: List[str],
+                             temperature: float = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Generate responses for multiple prompts concurrently.
+
+        Concurrency is bounded by the instance semaphore sized from
+        Config.OLLAMA_NUM_PARALLEL; Ollama serializes anything beyond its
+        own OLLAMA_NUM_PARALLEL anyway.
+
+        Args:
+            prompts: List of input prompts
+            temperature: Sampling temperature (0.0 to 1.0)
+
+        Returns:
+            List of response dictionaries (or None on failure), in input order
+        """
+        logger.info("Generating batch of %d prompts (max %d in parallel)",
+                    len(prompts), Config.OLLAMA_NUM_PARALLEL)
+        async with self.make_async_client() as client:
+            return await asyncio.gather(
+                *(self.agenerate_response(p, temperature, client) for p in prompts)
+            )
+
+    def warm_up(self) -> bool:
+        """
+        Load the model into memory with a minimal generate request.
+
+        Ollama keeps the model resident for OLLAMA_KEEP_ALIVE afterwards, so
+        paying the multi-second weight load here keeps it off the first
+        user's classification.
+
+        Returns:
+            True if the warm-up request succeeded, False otherwise
+        """
+        payload = {
+            "model": self.model,
+            "prompt": "ping",
+            "stream": False,
+            "options": {
+                "num_predict": 1,
+                "num_ctx": Config.NUM_CTX,
+                "temperature": 0.0
+            }
+        }
+
+        try:
+            response = self.session.post(
+                self.endpoint,
+                data=orjson.dumps(payload),
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            logger.info("Model warmed up (load_duration: %.2f s)",
+                        result.get('load_duration', 0) / 1e9)
+            return True
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {e}")
+            return False
+
     def check_health(self) -> bool:
         """
         Check if Ollama service is available.
@@ -105,7 +349,7 @@ class OllamaHandler:
             True if service is healthy, False otherwise
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
             logger.info("Ollama service is healthy")
             return True
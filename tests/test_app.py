@@ -3,6 +3,7 @@
 # ============================================================================
 
 import sys
+import asyncio
 from pathlib import Path
 
 # Add project root to path
@@ -44,11 +45,14 @@ def run_input_tests():
         }
     ]
     
-    for idx, case in enumerate(test_cases):
+    # Classify all cases in one concurrent batch instead of one blocking
+    # call per case
+    results = asyncio.run(classifier.classify_batch([case["text"] for case in test_cases]))
+
+    for idx, (case, result) in enumerate(zip(test_cases, results)):
         print(f"\nTest Case {idx + 1}:")
         text = case["text"]
-        result = classifier.classify(text)
-        
+
         if 'expected_error' in case:
             assert not result['success'], f"Expected failure but got success for input: {text}"
             assert case['expected_error'].lower() in result['error'].lower(), f"Error mismatch: {result['error']}"
@@ -4,14 +4,16 @@ Run with: python -m pytest tests/test_classifier.py -v
 """
 
 import sys
+import json
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.fake_news_classifier import FakeNewsClassifier
 from src.data_preprocessing import TextPreprocessor
+from src.model_handler import OllamaHandler
 
 # ============================================================================
 # 1️⃣ Text Preprocessing Tests
@@ -127,7 +129,79 @@ def test_classification_empty_input():
     print("✅ Empty input test passed")
 
 # ============================================================================
-# 3️⃣ Run All Tests
+# 3️⃣ Streaming Response Tests (with Mock)
+# ============================================================================
+
+def test_streaming_response_assembly():
+    # Ollama streams one JSON object per line; the label is split across
+    # chunks and the final done chunk carries the metadata
+    chunk_lines = [
+        json.dumps({"response": "CLASSIFI"}).encode(),
+        json.dumps({"response": "CATION: RE"}).encode(),
+        json.dumps({"response": "AL\nCONFIDENCE: 95\n"}).encode(),
+        json.dumps({
+            "response": "REASONING: Credible sources.",
+            "done": True,
+            "model": "gemma:latest",
+            "total_duration": 123,
+            "eval_count": 42
+        }).encode(),
+    ]
+
+    lines_consumed = 0
+
+    def fake_iter_lines():
+        nonlocal lines_consumed
+        for line in chunk_lines:
+            lines_consumed += 1
+            yield line
+
+    mock_response = MagicMock()
+    mock_response.iter_lines.return_value = fake_iter_lines()
+    mock_response.raise_for_status.return_value = None
+
+    labels = []
+    handler = OllamaHandler()
+
+    with patch.object(handler.session, 'post', return_value=mock_response):
+        result = handler.generate_response(
+            "prompt",
+            on_label=lambda label: labels.append((label, lines_consumed))
+        )
+
+    assert result['response'] == "CLASSIFICATION: REAL\nCONFIDENCE: 95\nREASONING: Credible sources."
+    assert result['model'] == "gemma:latest"
+    assert result['total_duration'] == 123
+    assert result['eval_count'] == 42
+
+    # The label fires as soon as it is complete, before the stream ends
+    assert labels == [("REAL", 3)]
+
+    print("✅ Streaming response assembly test passed")
+
+def test_streaming_early_label_fake():
+    chunk_lines = [
+        json.dumps({"response": "CLASSIFICATION: FAKE\n"}).encode(),
+        json.dumps({"response": "CONFIDENCE: 90\nREASONING: Sensational.", "done": True, "model": "gemma:latest"}).encode(),
+    ]
+
+    mock_response = MagicMock()
+    mock_response.iter_lines.return_value = iter(chunk_lines)
+    mock_response.raise_for_status.return_value = None
+
+    labels = []
+    handler = OllamaHandler()
+
+    with patch.object(handler.session, 'post', return_value=mock_response):
+        result = handler.generate_response("prompt", on_label=labels.append)
+
+    assert labels == ["FAKE"]
+    assert result['response'].endswith("REASONING: Sensational.")
+
+    print("✅ Streaming early FAKE label test passed")
+
+# ============================================================================
+# 4️⃣ Run All Tests
 # ============================================================================
 
 if __name__ == "__main__":
@@ -142,5 +216,8 @@ if __name__ == "__main__":
     test_classification_real_news()
     test_classification_fake_news()
     test_classification_empty_input()
-    
+
+    test_streaming_response_assembly()
+    test_streaming_early_label_fake()
+
     print("\n✅ All tests completed successfully!")